@@ -0,0 +1,95 @@
+# cython: language_level=3
+"""
+_acf_parser
+-----------
+Optional native fast path for SteamDBOffline's appmanifest_*.acf parsing.
+
+A hand-written scanner that does the same job as the regex parser in
+steamdb_offline.py, without going through Python bytecode per match.
+steamdb_offline uses it automatically when it is importable and falls back
+to the regex otherwise.
+
+Build in place (requires Cython and a C compiler):
+    pip install cython
+    cythonize -i _acf_parser.pyx
+
+Author: Khaled Developer
+GitHub: https://github.com/khaled-dev-loper/steamdb-offline
+License: MIT
+"""
+
+cdef enum:
+    QUOTE = 34  # '"'
+    MIN_KEY_LEN = 4  # "name"
+    MAX_KEY_LEN = 11  # "LastUpdated"
+
+cdef dict _KEY_MAP = {
+    b"appid": "steam_id",
+    b"name": "name",
+    b"installdir": "installdir",
+    b"LastUpdated": "last_updated",
+    b"StateFlags": "stateflags",
+    b"SizeOnDisk": "size_on_disk",
+}
+
+
+cdef inline bint _is_space(unsigned char c):
+    # Same set as the bytes-mode regex \s
+    return c == 32 or (9 <= c <= 13)
+
+
+def parse(bytes buf):
+    """
+    Extracts the known "key"  "value" pairs from the raw contents of an ACF file.
+
+    Args:
+        buf (bytes): Raw contents of the ACF file.
+
+    Returns:
+        dict: Information about the game (steam_id, name, installdir, etc.), exactly as
+        the regex parser in steamdb_offline would return it.
+    """
+    cdef const unsigned char* p = buf
+    cdef Py_ssize_t n = len(buf)
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t key_end, j, val_start, val_end
+    cdef dict info = {}
+    cdef object field
+
+    while i < n:
+        if p[i] != QUOTE:
+            i += 1
+            continue
+
+        # "key"
+        key_end = i + 1
+        while key_end < n and p[key_end] != QUOTE:
+            key_end += 1
+        if key_end >= n:
+            break
+        field = None
+        if MIN_KEY_LEN <= key_end - i - 1 <= MAX_KEY_LEN:
+            field = _KEY_MAP.get(buf[i + 1:key_end])
+        if field is None:
+            i += 1
+            continue
+
+        # \s+ then "value"
+        j = key_end + 1
+        while j < n and _is_space(p[j]):
+            j += 1
+        if j == key_end + 1 or j >= n or p[j] != QUOTE:
+            i += 1
+            continue
+        val_start = j + 1
+        val_end = val_start
+        while val_end < n and p[val_end] != QUOTE:
+            val_end += 1
+        if val_end >= n:
+            i += 1
+            continue
+
+        info[field] = buf[val_start:val_end].decode("utf-8")
+        i = val_end + 1
+
+    return info
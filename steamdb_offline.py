@@ -35,8 +35,19 @@ SOFTWARE.
 
 import os
 import json
-import glob
 import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # Optional: faster JSON output for the example script
+except ImportError:
+    orjson = None
+
+try:
+    from _acf_parser import parse as _native_parse_acf  # Optional: Cython ACF parser, see _acf_parser.pyx
+except ImportError:
+    _native_parse_acf = None
 
 class SteamDBOffline:
     """
@@ -64,6 +75,34 @@ class SteamDBOffline:
     License: MIT
     """
     VERSION = "1.0.0"
+
+    # Library paths in libraryfolders.vdf: "path" (new format) or "<index>" (old format).
+    # Escaped characters (\\ and \") inside the value are consumed as pairs.
+    _VDF_PATH_RE = re.compile(rb'"(?:path|\d+)"\s+"((?:[^"\\]|\\.)*)"')
+
+    # Matches the top-level "key"  "value" pairs we care about in an appmanifest.
+    _ACF_RE = re.compile(rb'"(appid|name|installdir|LastUpdated|StateFlags|SizeOnDisk)"\s+"([^"]*)"')
+    _KEY_MAP = {
+        b"appid": "steam_id",
+        b"name": "name",
+        b"installdir": "installdir",
+        b"LastUpdated": "last_updated",
+        b"StateFlags": "stateflags",
+        b"SizeOnDisk": "size_on_disk",
+    }
+
+    # (key, template) pairs for the per-game URLs; "%s" is replaced by the Steam App ID.
+    _URL_TEMPLATES = (
+        ("launch_url",        "steam://run/%s"),
+        ("logo",              "https://cdn.steamstatic.com/steam/apps/%s/logo.png"),
+        ("banner",            "https://cdn.cloudflare.steamstatic.com/steam/apps/%s/header.jpg"),
+        ("big_banner",        "https://cdn.cloudflare.steamstatic.com/steam/apps/%s/library_hero.jpg"),
+        ("vertical_banner",   "https://cdn.steamstatic.com/steam/apps/%s/library_600x900.jpg"),
+        ("horizontal_banner", "https://cdn.steamstatic.com/steam/apps/%s/capsule_231x87.jpg"),
+        ("info_banner",       "https://cdn.cloudflare.steamstatic.com/steam/apps/%s/page_bg_generated_v6b.jpg"),
+    )
+    _URL_TEMPLATE_MAP = dict(_URL_TEMPLATES)
+
     def __init__(self, main_steamapps_path = r"C:\Program Files (x86)\Steam\steamapps"):
         """
         Initializes the SteamDBOffline instance.
@@ -72,6 +111,24 @@ class SteamDBOffline:
             main_steamapps_path (str): Path to main steamapps directory.
         """
         self.main_steamapps_path = main_steamapps_path
+        # Results reused across get_games() calls, invalidated by file (mtime_ns, size):
+        #   vdf path -> (mtime_ns, size, library paths)
+        #   acf path -> (mtime_ns, size, parsed info)
+        self._lib_cache = {}
+        self._acf_cache = {}
+
+    @staticmethod
+    def __norm_path(path):
+        """
+        Normalizes a path for duplicate detection (symlinks resolved, case folded on Windows).
+
+        Args:
+            path (str): Path to normalize.
+
+        Returns:
+            str: The normalized path.
+        """
+        return os.path.normcase(os.path.normpath(os.path.realpath(path)))
 
     def __get_library_paths(self, steamapps_path):
         """
@@ -81,62 +138,150 @@ class SteamDBOffline:
             steamapps_path (str): Path to a steamapps folder to start from.
 
         Returns:
-            list[str]: A list of library 'steamapps' folder paths.
+            list[str]: A list of library 'steamapps' folder paths. Folders are not checked for
+            existence here; the directory scan in `get_games()` skips missing ones.
         """
         lib_paths = [steamapps_path]
         vdf_file = os.path.join(steamapps_path, 'libraryfolders.vdf')
-        if not os.path.exists(vdf_file):
+        try:
+            st = os.stat(vdf_file)
+        except OSError:
             return lib_paths
 
-        with open(vdf_file, encoding="utf-8") as f:
+        cached = self._lib_cache.get(vdf_file)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return list(cached[2])
+
+        # Compared in normalized form: the main library is usually listed in its own VDF too,
+        # possibly with different case, separators or through a symlink
+        seen = {self.__norm_path(steamapps_path)}
+        # Matched as bytes so only the extracted paths get decoded, not the whole file
+        with open(vdf_file, "rb") as f:
             data = f.read()
-        # New and old Steam library VDF formats supported
-        re_path_new = re.findall(r'"path"\s+"(.*?)"', data)
-        re_path_old = re.findall(r'"\d+"\s+"(.*?)"', data)
-        for path in re_path_new + re_path_old:
-            path = path.replace('\\\\', '\\').strip()
+        # New and old Steam library VDF formats supported, in a single scan
+        for path in self._VDF_PATH_RE.findall(data):
+            # VDF strings escape backslashes and quotes ("D:\\SteamLibrary"); undo just those on the
+            # bytes so any other backslash is kept as-is, then decode once
+            try:
+                path = path.replace(b'\\\\', b'\\').replace(b'\\"', b'"').decode("utf-8").strip()
+            except UnicodeDecodeError:
+                continue  # Not valid UTF-8, not a usable path
+            # Library paths are always absolute; this also drops the "<appid>"  "<size>" pairs
+            # of the "apps" blocks, which the "<index>" alternative matches as well
+            if not os.path.isabs(path):
+                continue
             app_folder = os.path.join(path, 'steamapps')
-            if os.path.exists(app_folder) and app_folder not in lib_paths:
+            norm_folder = self.__norm_path(app_folder)
+            if norm_folder not in seen:
+                seen.add(norm_folder)
                 lib_paths.append(app_folder)
-        lib_paths = list(set(lib_paths))
+        self._lib_cache[vdf_file] = (st.st_mtime_ns, st.st_size, list(lib_paths))
         return lib_paths
 
-    def __parse_acf(self, acf_path):
+    def __list_acf_files(self, steamapps_path):
         """
-        Parses a single appmanifest_*.acf file to extract game information.
+        Lists the appmanifest_*.acf files of a single library folder.
+
+        Args:
+            steamapps_path (str): Path to a library 'steamapps' folder.
+
+        Returns:
+            list[tuple[str, os.stat_result]]: (path, stat) of each ACF file found (empty if the folder is missing).
+        """
+        try:
+            it = os.scandir(steamapps_path)
+        except OSError:
+            return []
+
+        acf_files = []
+        with it:
+            for entry in it:
+                if not (entry.name.startswith("appmanifest_") and entry.name.endswith(".acf")):
+                    continue
+                try:
+                    if entry.is_file():
+                        acf_files.append((entry.path, entry.stat()))
+                except FileNotFoundError:
+                    continue  # Removed after the directory listing; skip just this one
+        return acf_files
+
+    def __read_acf(self, acf_path, size):
+        """
+        Reads a whole ACF file with a single read call.
 
         Args:
             acf_path (str): Path to the ACF file.
+            size (int): File size as reported by the directory scan.
 
         Returns:
-            dict: Information about the game (steam_id, name, installdir, etc.)
-        """
-        info = {}
-
-        if not os.path.exists(acf_path):
-            return info
-        
-        with open(acf_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith('"appid"'):
-                    info["steam_id"] = line.split('"')[3]
-                elif line.startswith('"name"'):
-                    info["name"] = line.split('"')[3]
-                elif line.startswith('"installdir"'):
-                    info["installdir"] = line.split('"')[3]
-                elif line.startswith('"LastUpdated"'):
-                    info["last_updated"] = line.split('"')[3]
-                elif line.startswith('"StateFlags"'):
-                    info["stateflags"] = line.split('"')[3]
-                elif line.startswith('"SizeOnDisk"'):
-                    info["size_on_disk"] = line.split('"')[3]
+            bytes or None: Raw file contents, or None if the file vanished since the directory scan
+            (e.g. Steam uninstalled the game or is rewriting the manifest).
+        """
+        try:
+            fd = os.open(acf_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        except FileNotFoundError:
+            return None
+        chunks = []
+        try:
+            # A regular file normally comes back in one read; keep going only on short reads
+            remaining = size
+            while remaining > 0:
+                chunk = os.read(fd, remaining)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                remaining -= len(chunk)
+        finally:
+            os.close(fd)
+        return b"".join(chunks)
+
+    def __parse_acf(self, acf_bytes):
+        """
+        Parses the contents of a single appmanifest_*.acf file to extract game information.
+
+        Args:
+            acf_bytes (bytes): Raw contents of the ACF file.
+
+        Returns:
+            dict or None: Information about the game (steam_id, name, installdir, etc.),
+            or None for Steamworks Redistributables.
+        """
+        if _native_parse_acf is not None:
+            info = _native_parse_acf(acf_bytes)
+        else:
+            # findall() hands back (key, value) tuples, avoiding a .group() call per match
+            info = {self._KEY_MAP[key]: value.decode("utf-8") for key, value in self._ACF_RE.findall(acf_bytes)}
+        # Filter out Steamworks Redistributables before any decoration happens
+        if info.get("name", "").lower().startswith("steamworks"):
+            return None
         return info
 
-    def get_games(self):
+    def get_url(self, game, key):
+        """
+        Formats one of the per-game URLs on demand, e.g. for games returned with `lazy_urls=True`.
+
+        Args:
+            game (dict): A game dictionary as returned by `get_games()`.
+            key (str): URL key: launch_url, logo, banner, big_banner, vertical_banner,
+                horizontal_banner or info_banner.
+
+        Returns:
+            str: The requested URL.
+        """
+        return self._URL_TEMPLATE_MAP[key] % game["steam_id"]
+
+    def get_games(self, lazy_urls=False, fields=None):
         """
         Enumerates all installed Steam games by scanning all library folders.
 
+        Args:
+            lazy_urls (bool): If True, the URL fields (launch_url, logo and the banners) are left out
+                of each dictionary and can be built on demand with `get_url()`. This keeps large
+                game lists much smaller in memory.
+            fields (set[str] | None): If given, only these keys are included in each dictionary,
+                e.g. {"name", "install_path"}; URLs for excluded keys are not built at all.
+                With `lazy_urls=True`, steam_id is always kept so the games still work with `get_url()`.
+
         Returns:
             list[dict]: A list of dictionaries, each containing game information:
                 - steam_id (str): Steam App ID
@@ -154,36 +299,113 @@ class SteamDBOffline:
                 - stateflags (str): Install state flags (if present)
                 - size_on_disk (str): Size in bytes (if present)
         """
+        return list(self.iter_games(lazy_urls=lazy_urls, fields=fields))
+
+    def iter_games(self, lazy_urls=False, fields=None):
+        """
+        Like `get_games()`, but yields each game as soon as its manifest has been read,
+        instead of building the whole list first.
+
+        Args:
+            lazy_urls (bool): See `get_games()`.
+            fields (set[str] | None): See `get_games()`.
+
+        Yields:
+            dict: Game information, with the same fields as in `get_games()`.
+        """
         library_paths = self.__get_library_paths(self.main_steamapps_path)
-        games = []
-        for steamapps_path in library_paths:
-            for acf_file in glob.glob(os.path.join(steamapps_path, "appmanifest_*.acf")):
-                info = self.__parse_acf(acf_file)
-                if not info: 
-                    continue
-                # Filter out Steamworks Redistributables
-                if info.get("name", "").lower().startswith("steamworks"):
+        acf_entries = [
+            (steamapps_path, acf_file, st)
+            for steamapps_path in library_paths
+            for acf_file, st in self.__list_acf_files(steamapps_path)
+        ]
+
+        # Only manifests that are new or changed since the last call need to be read again
+        old_cache = self._acf_cache
+        stale = []
+        for _, acf_file, st in acf_entries:
+            cached = old_cache.get(acf_file)
+            if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+                stale.append((acf_file, st))
+
+        executor = None
+        pending = deque()
+        if stale:
+            # ACF reads are I/O-bound, so read them concurrently and parse as results come in
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            pending.extend(executor.submit(self.__read_acf, acf_file, st.st_size) for acf_file, st in stale)
+        stale_files = {acf_file for acf_file, _ in stale}
+        # "<library>/common/" joined once per library; install paths are then plain concatenation
+        common_prefixes = {steamapps_path: os.path.join(steamapps_path, "common", "") for steamapps_path in library_paths}
+
+        # Decide once which derived fields to build, instead of checking per game
+        if fields is not None:
+            fields = frozenset(fields)
+            if lazy_urls:
+                # get_url() needs the App ID to build the left-out URLs later
+                fields |= {"steam_id"}
+        with_install_path = fields is None or "install_path" in fields
+        url_templates = () if lazy_urls else tuple(
+            (key, template) for key, template in self._URL_TEMPLATES
+            if fields is None or key in fields
+        )
+
+        acf_cache = {}
+        completed = False
+        try:
+            for steamapps_path, acf_file, st in acf_entries:
+                if acf_file in stale_files:
+                    # Popped so a consumed read's bytes are not kept alive by the queue
+                    acf_bytes = pending.popleft().result()
+                    if acf_bytes is None:
+                        continue  # Gone since the scan; not cached, so it is looked at again next time
+                    cached = (st.st_mtime_ns, st.st_size, self.__parse_acf(acf_bytes))
+                else:
+                    cached = old_cache[acf_file]
+                acf_cache[acf_file] = cached
+                info = cached[2]
+                if not info:
                     continue
 
-                info["install_path"]         = os.path.join(steamapps_path, "common", info.get("installdir", ""))
-                info["launch_url"]           = f"steam://run/{info['steam_id']}"
-                info["logo"]                 = f"https://cdn.steamstatic.com/steam/apps/{info['steam_id']}/logo.png"
-                info["banner"]               = f"https://cdn.cloudflare.steamstatic.com/steam/apps/{info['steam_id']}/header.jpg"
-                info["big_banner"]           = f"https://cdn.cloudflare.steamstatic.com/steam/apps/{info['steam_id']}/library_hero.jpg"
-                info["vertical_banner"]      = f"https://cdn.steamstatic.com/steam/apps/{info['steam_id']}/library_600x900.jpg"
-                info["horizontal_banner"]    = f"https://cdn.steamstatic.com/steam/apps/{info['steam_id']}/capsule_231x87.jpg"
-                info["info_banner"]          = f"https://cdn.cloudflare.steamstatic.com/steam/apps/{info['steam_id']}/page_bg_generated_v6b.jpg"
-                games.append(info)
-        return games
+                steam_id = info["steam_id"]
+                installdir = info.get("installdir", "")
+                if fields is None:
+                    info = dict(info)
+                else:
+                    info = {key: value for key, value in info.items() if key in fields}
+                if with_install_path:
+                    info["install_path"] = common_prefixes[steamapps_path] + installdir
+                for key, template in url_templates:
+                    info[key] = template % steam_id
+                yield info
+            completed = True
+        finally:
+            if executor is not None:
+                # The caller may stop early: drop the reads that have not started yet
+                # (shutdown(cancel_futures=True) would need Python 3.9+)
+                for future in pending:
+                    future.cancel()
+                executor.shutdown(wait=False)
+            if completed:
+                # Dropping entries not seen in this scan keeps uninstalled games from piling up
+                self._acf_cache = acf_cache
+            else:
+                # The caller stopped early: keep what was parsed so far
+                old_cache.update(acf_cache)
 
 # Example usage:
 if __name__ == "__main__":
     steamdb = SteamDBOffline()
     games = steamdb.get_games()
     filename = "my_steam_local_games_full.json"
-    with open(filename, "w", encoding="utf-8") as outfile:
-        json.dump(games, outfile, ensure_ascii=False, indent=4)
-        print(f"File '{filename}' Created.")
+    if orjson is not None:
+        with open(filename, "wb") as outfile:
+            outfile.write(orjson.dumps(games, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, "w", encoding="utf-8") as outfile:
+            json.dump(games, outfile, ensure_ascii=False, separators=(",", ":"))
+    print(f"File '{filename}' Created.")
     print(f"{len(games)} Games found!\n")
     for i, g in enumerate(games):
         print(f"{i+1}. {g['name']}")